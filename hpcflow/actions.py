@@ -1,19 +1,15 @@
 import copy
 from dataclasses import dataclass, field
 import enum
-from lib2to3.pytree import Base
-from re import I
 from typing import Dict, List, Optional, Tuple
-from numpy import isin, sort
 
 from valida.conditions import ConditionLike
 
 from hpcflow.command_files import InputFileGenerator, OutputFileParser
-from hpcflow.commands import Command, CommandArgument
+from hpcflow.commands import Command
 from hpcflow.environment import Environment
-from hpcflow.errors import MissingActionEnvironment, MissingCompatibleActionEnvironment
+from hpcflow.errors import MissingCompatibleActionEnvironment
 from hpcflow.parameters import SchemaParameter
-from hpcflow.utils import classproperty
 
 
 class ActionScopeType(enum.Enum):
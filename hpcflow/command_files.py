@@ -1,6 +1,5 @@
 from dataclasses import dataclass
 from pathlib import Path
-from re import I
 from typing import Dict, List, Union
 
 
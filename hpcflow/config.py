@@ -1,5 +1,5 @@
 from pathlib import Path
-from ruamel.yaml import YAML, safe_load
+from ruamel.yaml import safe_load
 
 
 class Config:
@@ -1,6 +1,5 @@
 from dataclasses import dataclass, field
-import re
-from typing import List, Any, Dict, Optional, Sequence, Union
+from typing import List, Any, Optional, Sequence
 
 from textwrap import dedent
 
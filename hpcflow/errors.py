@@ -1,6 +1,3 @@
-from multiprocessing.sharedctypes import Value
-
-
 class InputValueDuplicateSequenceAddress(ValueError):
     pass
 
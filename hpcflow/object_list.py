@@ -3,6 +3,7 @@ class DotAccessObjectList:
         self._objects = list(objects)
         self._access_attribute = access_attribute
         self._descriptor = descriptor
+        self._lookup = None  # access-attribute value to object map; built on demand
 
         if self._objects:
 
@@ -32,10 +33,37 @@ class DotAccessObjectList:
     def __eq__(self, other):
         return self._objects == other
 
+    def __copy__(self):
+        # `add_object` inserts in place, so a copy must not share the objects list:
+        obj = self.__class__.__new__(self.__class__)
+        obj.__dict__.update(self.__dict__)
+        obj._objects = list(self._objects)
+        obj._lookup = None
+        return obj
+
+    def _get_lookup(self):
+        """Get the map of access-attribute values to objects, building it if it has been
+        invalidated. Where multiple objects share a value, the first is retained. The map
+        may be stale if an object's access attribute has been modified; `__getattr__`
+        rebuilds it in that case."""
+        if self._lookup is None:
+            self._lookup = {}
+            for obj in self._objects:
+                self._lookup.setdefault(getattr(obj, self._access_attribute), obj)
+        return self._lookup
+
     def __getattr__(self, attribute):
-        for obj in self._objects:
-            if getattr(obj, self._access_attribute) == attribute:
-                return obj
+        if attribute.startswith("_"):
+            # private/dunder probes (e.g. `__deepcopy__`, or `_lookup` on an instance
+            # created without `__init__`) should not build the lookup map:
+            raise AttributeError(attribute)
+        obj = self._get_lookup().get(attribute)
+        if obj is None or getattr(obj, self._access_attribute) != attribute:
+            # access attributes may have been modified since the map was built:
+            self._lookup = None
+            obj = self._get_lookup().get(attribute)
+        if obj is not None:
+            return obj
 
         obj_list_fmt = ", ".join(
             [f'"{getattr(i, self._access_attribute)}"' for i in self._objects]
@@ -58,7 +86,8 @@ class DotAccessObjectList:
             )
         if index < 0:
             index += len(self) + 1
-        self._objects = self._objects[:index] + [obj] + self._objects[index:]
+        self._objects.insert(index, obj)
+        self._lookup = None
 
 
 class TaskList(DotAccessObjectList):
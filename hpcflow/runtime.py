@@ -1,4 +1,3 @@
-from imp import is_frozen
 import os
 from pathlib import Path
 import sys
@@ -12,10 +12,10 @@ from hpcflow.errors import (
     WorkflowSpecValidationError,
     EnvironmentSpecValidationError,
 )
-from hpcflow.parameters import Parameter, SchemaInput, SchemaOutput
+from hpcflow.parameters import Parameter
 from hpcflow.task_schema import TaskSchema
 from hpcflow.workflow import WorkflowTemplate
-from hpcflow.environment import Executable, ExecutableInstance, Environment
+from hpcflow.environment import Environment
 
 
 def get_workflow_spec_schema():
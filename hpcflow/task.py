@@ -1,9 +1,7 @@
-from dataclasses import dataclass
-from optparse import Option
 from typing import Dict, List, Optional, Tuple, Union
 from hpcflow.command_files import FileSpec
 
-from hpcflow.element import Element, ElementFilter, ElementGroup
+from hpcflow.element import ElementFilter, ElementGroup
 from hpcflow.errors import (
     MissingInputs,
     TaskTemplateInvalidNesting,
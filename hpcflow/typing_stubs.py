@@ -1,6 +1,3 @@
-from calendar import c
-
-
 class SubParameter:
     pass
 
@@ -32,11 +32,11 @@ def get_duplicate_items(lst):
     []
 
     >>> get_duplicate_items([1, 2, 3, 3, 3, 2])
-    [2, 3, 2]
+    [2, 3]
 
     """
-    seen = []
-    return list(set(x for x in lst if x in seen or seen.append(x)))
+    seen = set()
+    return list(set(x for x in lst if x in seen or seen.add(x)))
 
 
 def check_valid_py_identifier(name):
@@ -184,8 +184,9 @@ def get_relative_path(path1, path2):
 
 def search_dir_files_by_regex(pattern, group=0, directory="."):
     vals = []
+    regex = re.compile(pattern)
     for i in Path(directory).iterdir():
-        match = re.search(pattern, i.name)
+        match = regex.search(i.name)
         if match:
             match_groups = match.groups()
             if match_groups:
@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass
 from operator import itemgetter
 from typing import List, Optional
@@ -36,6 +37,21 @@ class WorkflowTemplate:
         for task_template in task_templates or []:
             self.add_task(task_template)
 
+    def __deepcopy__(self, memo):
+        """Copy all data, including the task templates, and rebuild the `Task` wrappers
+        so that they reference the new workflow template. Task schemas and parameters
+        are mutable, so they are not shared with the original."""
+        obj = self.__class__.__new__(self.__class__)
+        memo[id(self)] = obj
+        for k, v in self.__dict__.items():
+            if k != "tasks":
+                setattr(obj, k, copy.deepcopy(v, memo))
+        obj.tasks = TaskList()
+        for idx, task in enumerate(self.tasks):
+            template = copy.deepcopy(task.template, memo)
+            obj.tasks.add_object(Task(template, obj, idx))
+        return obj
+
     def get_possible_input_sources(
         self, schema_input: SchemaInput, new_task: TaskTemplate, new_index: int
     ):
@@ -44,14 +60,14 @@ class WorkflowTemplate:
 
         # Get parameters provided by tasks up to `new_index`:
         task_sources = {}
-        for task in self.tasks[:new_index]:
+        for task_idx, task in enumerate(self.tasks[:new_index]):
             provided = tuple(
                 i
                 for i in task.template.provides_parameters
                 if i.typ == schema_input.typ
             )
             if provided:
-                task_sources.update({(task.index, task.unique_name): provided})
+                task_sources.update({(task_idx, task.unique_name): provided})
 
         out = {
             "imports": {},
@@ -256,16 +272,14 @@ class WorkflowTemplate:
                     f"`nesting_order` of {para_sequences[0]['nesting_order']}."
                 )
 
+            addresses = [i["address"] for i in para_sequences]
             new_elements = []
             for val_idx in range(para_sequences[0]["multiplicity"]):
+                # same for all elements, so build once per value index:
+                val_idx_map = dict.fromkeys(addresses, val_idx)
                 for element in elements:
                     new_elements.append(
-                        {
-                            "value_index": {
-                                **element["value_index"],
-                                **{i["address"]: val_idx for i in para_sequences},
-                            }
-                        }
+                        {"value_index": {**element["value_index"], **val_idx_map}}
                     )
             elements = new_elements
 
@@ -283,15 +297,18 @@ class WorkflowTemplate:
     def get_input_values(self, task_index, parameter_path):
         """Get the value of an input for each element in a task."""
         return [
-            self.get_input_value(
-                task_index=task_index, element_index=i, parameter_path=parameter_path
-            )
-            for i in range(self.tasks[task_index].num_elements)
+            self._get_element_input_value(self.elements[i], parameter_path)
+            for i in self.tasks[task_index].element_indices
         ]
 
     def get_input_value(self, task_index, element_index, parameter_path):
 
         element = self.elements[self.tasks[task_index].element_indices[element_index]]
+        return self._get_element_input_value(element, parameter_path)
+
+    def _get_element_input_value(self, element, parameter_path):
+        """Get the value of an input for a given element data dict."""
+
         current_value = None
         for input_i in element["inputs"]:
 
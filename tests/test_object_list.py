@@ -1,8 +1,10 @@
+import copy
 from dataclasses import dataclass
+import pickle
 
 import pytest
 
-from hpcflow.object_list import DotAccessObjectList
+from hpcflow.object_list import DotAccessObjectList, GroupList
 
 
 @dataclass
@@ -27,7 +29,8 @@ def test_get_item(simple_object_list):
     objects = simple_object_list["objects"]
     obj_list = simple_object_list["object_list"]
 
-    assert obj_list[0] == objects[0] and obj_list[1] == objects[1]
+    assert obj_list[0] == objects[0]
+    assert obj_list[1] == objects[1]
 
 
 def test_get_dot_notation(simple_object_list):
@@ -35,25 +38,60 @@ def test_get_dot_notation(simple_object_list):
     objects = simple_object_list["objects"]
     obj_list = simple_object_list["object_list"]
 
-    assert obj_list.A == objects[0] and obj_list.B == objects[1]
+    assert obj_list.A == objects[0]
+    assert obj_list.B == objects[1]
 
 
-def test_add_obj_to_end(simple_object_list):
+@pytest.mark.parametrize(
+    "index,expected_index",
+    [(-1, -1), (0, 0), (1, 1)],
+    ids=["end", "start", "middle"],
+)
+def test_add_obj(simple_object_list, index, expected_index):
     obj_list = simple_object_list["object_list"]
     new_obj = MyObj("C", 3)
-    obj_list.add_object(new_obj)
-    assert obj_list[-1] == new_obj
+    obj_list.add_object(new_obj, index)
+    assert obj_list[expected_index] == new_obj
 
 
-def test_add_obj_to_start(simple_object_list):
+def test_get_dot_notation_after_add_obj(simple_object_list):
     obj_list = simple_object_list["object_list"]
+    assert obj_list.A == simple_object_list["objects"][0]
     new_obj = MyObj("C", 3)
-    obj_list.add_object(new_obj, 0)
-    assert obj_list[0] == new_obj
+    obj_list.add_object(new_obj)
+    assert obj_list.C == new_obj
+
+
+def test_raise_on_private_attribute_without_init():
+    obj_list = DotAccessObjectList.__new__(DotAccessObjectList)
+    with pytest.raises(AttributeError):
+        obj_list.__wrapped__
+
+
+def test_get_dot_notation_after_access_attribute_change(simple_object_list):
+    obj_list = simple_object_list["object_list"]
+    obj = simple_object_list["objects"][0]
+    assert obj_list.A == obj
+    obj.name = "D"
+    assert obj_list.D == obj
+    assert not hasattr(obj_list, "A")
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_copy_empty_object_list(copier):
+    assert len(copier(GroupList())) == 0
 
 
-def test_add_obj_to_middle(simple_object_list):
+def test_add_obj_to_copy_does_not_modify_original(simple_object_list):
     obj_list = simple_object_list["object_list"]
+    assert obj_list.A == simple_object_list["objects"][0]
+    obj_list_copy = copy.copy(obj_list)
     new_obj = MyObj("C", 3)
-    obj_list.add_object(new_obj, 1)
-    assert obj_list[1] == new_obj
+    obj_list_copy.add_object(new_obj)
+    assert obj_list_copy.C == new_obj
+    assert len(obj_list) == 2
+    assert not hasattr(obj_list, "C")
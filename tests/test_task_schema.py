@@ -1,4 +1,3 @@
-from multiprocessing import dummy
 import pytest
 from hpcflow.actions import Action
 from hpcflow.commands import Command
@@ -38,19 +37,14 @@ def test_init_with_method_with_underscore(dummy_schema_args):
     TaskSchema(method="my_method", **dummy_schema_args)
 
 
-def test_raise_on_invalid_method_digit(dummy_schema_args):
+@pytest.mark.parametrize(
+    "method",
+    ["9", "my method", "_mymethod"],
+    ids=["digit", "space", "non_alpha_numeric"],
+)
+def test_raise_on_invalid_method(dummy_schema_args, method):
     with pytest.raises(InvalidIdentifier):
-        TaskSchema(method="9", **dummy_schema_args)
-
-
-def test_raise_on_invalid_method_space(dummy_schema_args):
-    with pytest.raises(InvalidIdentifier):
-        TaskSchema(method="my method", **dummy_schema_args)
-
-
-def test_raise_on_invalid_method_non_alpha_numeric(dummy_schema_args):
-    with pytest.raises(InvalidIdentifier):
-        TaskSchema(method="_mymethod", **dummy_schema_args)
+        TaskSchema(method=method, **dummy_schema_args)
 
 
 def test_method_lowercasing(dummy_schema_args):
@@ -69,9 +69,8 @@ def test_expected_return_defined_and_undefined_input_types():
         input_values=[InputValue(grid_size, value=[8, 8, 8])],
     )
 
-    assert task.defined_input_types == {"grid_size"} and task.undefined_input_types == {
-        "size"
-    }
+    assert task.defined_input_types == {"grid_size"}
+    assert task.undefined_input_types == {"size"}
 
 
 def test_expected_return_all_schema_input_types_single_schema():
@@ -101,86 +100,46 @@ def test_expected_return_all_schema_input_types_multiple_schemas():
     assert task.all_schema_input_types == {"grid_size", "size", "buffer_layer"}
 
 
-def test_expected_unique_name_single_schema():
-    schema = TaskSchema(objective=TaskObjective("simulate"))
-    task = TaskTemplate(schema)
-    assert task.unique_name == "simulate"
-
-
-def test_expected_unique_name_single_schema_with_method():
-    schema = TaskSchema(objective=TaskObjective("simulate"), method="method1")
-    task = TaskTemplate(schema)
-    assert task.unique_name == "simulate_method1"
-
-
-def test_expected_unique_name_single_schema_with_implementation():
-    schema = TaskSchema(objective=TaskObjective("simulate"), implementation="i1")
-    task = TaskTemplate(schema)
-    assert task.unique_name == "simulate_i1"
-
-
-def test_expected_unique_name_single_schema_with_method_and_implementation():
-    schema = TaskSchema(
-        objective=TaskObjective("simulate"), method="method1", implementation="i1"
-    )
-    task = TaskTemplate(schema)
-    assert task.unique_name == "simulate_method1_i1"
-
-
-def test_expected_unique_name_multiple_schemas():
-    objective = TaskObjective("simulate")
-    schema_1 = TaskSchema(objective)
-    schema_2 = TaskSchema(objective)
-    task = TaskTemplate([schema_1, schema_2])
-    assert task.unique_name == "simulate"
-
-
-def test_expected_unique_name_two_schemas_first_with_method():
-    objective = TaskObjective("simulate")
-    schema_1 = TaskSchema(objective, method="m1")
-    schema_2 = TaskSchema(objective)
-    task = TaskTemplate([schema_1, schema_2])
-    assert task.unique_name == "simulate_m1"
-
-
-def test_expected_unique_name_two_schemas_first_with_method_and_implementation():
-    objective = TaskObjective("simulate")
-    schema_1 = TaskSchema(objective, method="m1", implementation="i1")
-    schema_2 = TaskSchema(objective)
-    task = TaskTemplate([schema_1, schema_2])
-    assert task.unique_name == "simulate_m1_i1"
-
-
-def test_expected_unique_name_two_schemas_both_with_method():
-    objective = TaskObjective("simulate")
-    schema_1 = TaskSchema(objective, method="m1")
-    schema_2 = TaskSchema(objective, method="m2")
-    task = TaskTemplate([schema_1, schema_2])
-    assert task.unique_name == "simulate_m1_and_m2"
-
-
-def test_expected_unique_name_two_schemas_first_with_method_second_with_implementation():
-    objective = TaskObjective("simulate")
-    schema_1 = TaskSchema(objective, method="m1")
-    schema_2 = TaskSchema(objective, implementation="i2")
-    task = TaskTemplate([schema_1, schema_2])
-    assert task.unique_name == "simulate_m1_and_i2"
-
-
-def test_expected_unique_name_two_schemas_first_with_implementation_second_with_method():
-    objective = TaskObjective("simulate")
-    schema_1 = TaskSchema(objective, implementation="i1")
-    schema_2 = TaskSchema(objective, method="m2")
-    task = TaskTemplate([schema_1, schema_2])
-    assert task.unique_name == "simulate_i1_and_m2"
-
-
-def test_expected_unique_name_two_schemas_both_with_method_and_implementation():
+@pytest.mark.parametrize(
+    "schemas_kwargs,expected",
+    [
+        ([{}], "simulate"),
+        ([{"method": "method1"}], "simulate_method1"),
+        ([{"implementation": "i1"}], "simulate_i1"),
+        ([{"method": "method1", "implementation": "i1"}], "simulate_method1_i1"),
+        ([{}, {}], "simulate"),
+        ([{"method": "m1"}, {}], "simulate_m1"),
+        ([{"method": "m1", "implementation": "i1"}, {}], "simulate_m1_i1"),
+        ([{"method": "m1"}, {"method": "m2"}], "simulate_m1_and_m2"),
+        ([{"method": "m1"}, {"implementation": "i2"}], "simulate_m1_and_i2"),
+        ([{"implementation": "i1"}, {"method": "m2"}], "simulate_i1_and_m2"),
+        (
+            [
+                {"method": "m1", "implementation": "i1"},
+                {"method": "m2", "implementation": "i2"},
+            ],
+            "simulate_m1_i1_and_m2_i2",
+        ),
+    ],
+    ids=[
+        "single_schema",
+        "single_schema_with_method",
+        "single_schema_with_implementation",
+        "single_schema_with_method_and_implementation",
+        "multiple_schemas",
+        "two_schemas_first_with_method",
+        "two_schemas_first_with_method_and_implementation",
+        "two_schemas_both_with_method",
+        "two_schemas_first_with_method_second_with_implementation",
+        "two_schemas_first_with_implementation_second_with_method",
+        "two_schemas_both_with_method_and_implementation",
+    ],
+)
+def test_expected_unique_name(schemas_kwargs, expected):
     objective = TaskObjective("simulate")
-    schema_1 = TaskSchema(objective, method="m1", implementation="i1")
-    schema_2 = TaskSchema(objective, method="m2", implementation="i2")
-    task = TaskTemplate([schema_1, schema_2])
-    assert task.unique_name == "simulate_m1_i1_and_m2_i2"
+    schemas = [TaskSchema(objective, **i) for i in schemas_kwargs]
+    task = TaskTemplate(schemas)
+    assert task.unique_name == expected
 
 
 def test_resolve_elements():
@@ -22,36 +22,23 @@ def test_get_list_duplicate_items_all_duplicates():
     assert get_duplicate_items(lst) == [1]
 
 
-def test_raise_check_valid_py_identifier_empty_str():
-    with pytest.raises(ValueError):
-        check_valid_py_identifier("")
-
-
-def test_raise_check_valid_py_identifier_start_digit():
-    with pytest.raises(ValueError):
-        check_valid_py_identifier("9sdj")
-
-
-def test_raise_check_valid_py_identifier_single_digit():
-    with pytest.raises(ValueError):
-        check_valid_py_identifier("9")
-
-
-def test_raise_check_valid_py_identifier_py_keyword():
+@pytest.mark.parametrize(
+    "name",
+    ["", "9sdj", "9", "if"],
+    ids=["empty_str", "start_digit", "single_digit", "py_keyword"],
+)
+def test_raise_check_valid_py_identifier(name):
     with pytest.raises(ValueError):
-        check_valid_py_identifier("if")
-
-
-def test_expected_return_check_valid_py_identifier_all_latin_alpha():
-    assert check_valid_py_identifier("abc") == "abc"
-
+        check_valid_py_identifier(name)
 
-def test_expected_return_check_valid_py_identifier_all_latin_alphanumeric():
-    assert check_valid_py_identifier("abc123") == "abc123"
 
-
-def test_expected_return_check_valid_py_identifier_all_greek_alpha():
-    assert check_valid_py_identifier("αβγ") == "αβγ"
+@pytest.mark.parametrize(
+    "name",
+    ["abc", "abc123", "αβγ"],
+    ids=["all_latin_alpha", "all_latin_alphanumeric", "all_greek_alpha"],
+)
+def test_expected_return_check_valid_py_identifier(name):
+    assert check_valid_py_identifier(name) == name
 
 
 def test_check_valid_py_identifier_case_insensitivity():
@@ -63,71 +50,40 @@ def test_check_valid_py_identifier_case_insensitivity():
     )
 
 
-def test_expected_return_group_by_dict_key_values_single_key_items_single_key_passed():
-    item_1 = {"b": 1}
-    item_2 = {"b": 2}
-    item_3 = {"b": 1}
-    assert group_by_dict_key_values([item_1, item_2, item_3], "b") == [
-        [item_1, item_3],
-        [item_2],
-    ]
-
-
-def test_expected_return_group_by_dict_key_values_multi_key_items_single_key_passed():
-    item_1 = {"a": 9, "b": 1}
-    item_2 = {"a": 8, "b": 2}
-    item_3 = {"a": 9, "b": 1}
-    assert group_by_dict_key_values([item_1, item_2, item_3], "b") == [
-        [item_1, item_3],
-        [item_2],
-    ]
-
-
-def test_expected_return_group_by_dict_key_values_multi_key_items_multi_key_passed_two_groups():
-    item_1 = {"a": 9, "b": 1}
-    item_2 = {"a": 8, "b": 2}
-    item_3 = {"a": 9, "b": 1}
-    assert group_by_dict_key_values([item_1, item_2, item_3], "a", "b") == [
-        [item_1, item_3],
-        [item_2],
-    ]
-
-
-def test_expected_return_group_by_dict_key_values_multi_key_items_multi_key_passed_three_groups():
-    item_1 = {"a": 9, "b": 1}
-    item_2 = {"a": 9, "b": 2}
-    item_3 = {"a": 8, "b": 1}
-    assert group_by_dict_key_values([item_1, item_2, item_3], "a", "b") == [
-        [item_1],
-        [item_2],
-        [item_3],
-    ]
-
-
-def test_expected_return_group_by_dict_key_values_multi_key_items_multi_key_passed_one_group():
-    item_1 = {"a": 9, "b": 1}
-    item_2 = {"a": 9, "b": 1}
-    item_3 = {"a": 9, "b": 1}
-    assert group_by_dict_key_values([item_1, item_2, item_3], "a", "b") == [
-        [item_1, item_2, item_3]
-    ]
-
-
-def test_expected_return_group_by_dict_key_values_excluded_items_for_missing_keys_first_item():
-    item_1 = {"a": 9}
-    item_2 = {"a": 9, "b": 1}
-    item_3 = {"a": 9, "b": 1}
-    assert group_by_dict_key_values([item_1, item_2, item_3], "a", "b") == [
-        [item_1],
-        [item_2, item_3],
-    ]
-
-
-def test_expected_return_group_by_dict_key_values_excluded_items_for_missing_keys_second_item():
-    item_1 = {"a": 9, "b": 1}
-    item_2 = {"a": 9}
-    item_3 = {"a": 9, "b": 1}
-    assert group_by_dict_key_values([item_1, item_2, item_3], "a", "b") == [
-        [item_1, item_3],
-        [item_2],
+@pytest.mark.parametrize(
+    "items,keys,expected_groups",
+    [
+        ([{"b": 1}, {"b": 2}, {"b": 1}], ("b",), [[0, 2], [1]]),
+        ([{"a": 9, "b": 1}, {"a": 8, "b": 2}, {"a": 9, "b": 1}], ("b",), [[0, 2], [1]]),
+        (
+            [{"a": 9, "b": 1}, {"a": 8, "b": 2}, {"a": 9, "b": 1}],
+            ("a", "b"),
+            [[0, 2], [1]],
+        ),
+        (
+            [{"a": 9, "b": 1}, {"a": 9, "b": 2}, {"a": 8, "b": 1}],
+            ("a", "b"),
+            [[0], [1], [2]],
+        ),
+        (
+            [{"a": 9, "b": 1}, {"a": 9, "b": 1}, {"a": 9, "b": 1}],
+            ("a", "b"),
+            [[0, 1, 2]],
+        ),
+        ([{"a": 9}, {"a": 9, "b": 1}, {"a": 9, "b": 1}], ("a", "b"), [[0], [1, 2]]),
+        ([{"a": 9, "b": 1}, {"a": 9}, {"a": 9, "b": 1}], ("a", "b"), [[0, 2], [1]]),
+    ],
+    ids=[
+        "single_key_items_single_key_passed",
+        "multi_key_items_single_key_passed",
+        "multi_key_items_multi_key_passed_two_groups",
+        "multi_key_items_multi_key_passed_three_groups",
+        "multi_key_items_multi_key_passed_one_group",
+        "excluded_items_for_missing_keys_first_item",
+        "excluded_items_for_missing_keys_second_item",
+    ],
+)
+def test_expected_return_group_by_dict_key_values(items, keys, expected_groups):
+    assert group_by_dict_key_values(items, *keys) == [
+        [items[i] for i in group] for group in expected_groups
     ]
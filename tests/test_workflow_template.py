@@ -0,0 +1,118 @@
+import copy
+
+import pytest
+
+from hpcflow.actions import Action
+from hpcflow.commands import Command
+from hpcflow.parameters import InputValue, Parameter, ValueSequence
+from hpcflow.task import TaskTemplate
+from hpcflow.task_schema import TaskSchema
+from hpcflow.workflow import WorkflowTemplate
+
+
+@pytest.fixture
+def param_p1():
+    return Parameter("p1")
+
+
+@pytest.fixture
+def param_p2():
+    return Parameter("p2")
+
+
+@pytest.fixture
+def act_1():
+    return Action(commands=[Command("ls")], environments=[])
+
+
+@pytest.fixture
+def workflow_template_seq(param_p1, act_1):
+    schema = TaskSchema("t1", actions=[act_1], inputs=[param_p1])
+    seq_path = ("inputs", "p1", "a")
+    task = TaskTemplate(
+        schema,
+        inputs=[InputValue(param_p1, value={"a": 0})],
+        sequences=[ValueSequence(path=seq_path, values=[1, 2, 3], nesting_order=0)],
+        nesting_order={seq_path: 0},
+    )
+    return WorkflowTemplate(task_templates=[task])
+
+
+def test_expected_return_get_input_values(workflow_template_seq):
+    assert workflow_template_seq.get_input_values(0, ("inputs", "p1", "a")) == [1, 2, 3]
+
+
+def test_get_input_values_equivalence_with_get_input_value(workflow_template_seq):
+    path = ("inputs", "p1", "a")
+    assert workflow_template_seq.get_input_values(0, path) == [
+        workflow_template_seq.get_input_value(0, i, path) for i in range(3)
+    ]
+
+
+def test_task_output_input_source_expected_task_index_and_name(
+    param_p1, param_p2, act_1
+):
+    s1 = TaskSchema("t1", actions=[act_1], inputs=[param_p1], outputs=[param_p2])
+    s2 = TaskSchema("t2", actions=[act_1], inputs=[param_p2])
+    wkt = WorkflowTemplate(
+        task_templates=[
+            TaskTemplate(s1, inputs=[InputValue(param_p1, value=101)]),
+            TaskTemplate(s2),
+        ]
+    )
+    sources = wkt.get_possible_input_sources(s2.inputs[0], wkt.tasks.t2.template, 1)
+    assert list(sources["tasks"].keys()) == [(0, "t1")]
+
+
+def test_deepcopy_task_workflow_reference(workflow_template_seq):
+    wkt_copy = copy.deepcopy(workflow_template_seq)
+    assert wkt_copy.tasks.t1.workflow is wkt_copy
+
+
+def test_deepcopy_independent_task_templates(workflow_template_seq, param_p2):
+    wkt_copy = copy.deepcopy(workflow_template_seq)
+    template = workflow_template_seq.tasks.t1.template
+    num_inputs = len(template.inputs)
+    wkt_copy.tasks.t1.template.inputs.append(InputValue(param_p2, value=1))
+    assert len(template.inputs) == num_inputs
+    assert template.schemas[0] is not wkt_copy.tasks.t1.template.schemas[0]
+
+
+def test_deepcopy_independent_data(workflow_template_seq, param_p2, act_1):
+    wkt_copy = copy.deepcopy(workflow_template_seq)
+    num_elements = len(workflow_template_seq.elements)
+    num_params = len(workflow_template_seq.parameter_data)
+    schema = TaskSchema("t2", actions=[act_1], inputs=[param_p2])
+    wkt_copy.add_task(TaskTemplate(schema, inputs=[InputValue(param_p2, value=1)]))
+    assert len(workflow_template_seq.tasks) == 1
+    assert len(workflow_template_seq.elements) == num_elements
+    assert len(workflow_template_seq.parameter_data) == num_params
+    assert wkt_copy.get_input_values(0, ("inputs", "p1", "a")) == [1, 2, 3]
+
+
+def test_deepcopy_includes_all_attributes(workflow_template_seq):
+    workflow_template_seq.extra = {"a": [1]}
+    wkt_copy = copy.deepcopy(workflow_template_seq)
+    assert wkt_copy.extra == workflow_template_seq.extra
+    assert wkt_copy.extra is not workflow_template_seq.extra
+
+
+def test_expected_return_resolve_initial_elements():
+    multi = [
+        {"multiplicity": 1, "nesting_order": -1, "address": ("inputs",)},
+        {"multiplicity": 2, "nesting_order": 1, "address": ("inputs", "p2")},
+        {"multiplicity": 3, "nesting_order": 0, "address": ("inputs", "p1")},
+        {"multiplicity": 3, "nesting_order": 0, "address": ("inputs", "p3")},
+    ]
+    assert WorkflowTemplate.resolve_initial_elements(multi) == [
+        {
+            "value_index": {
+                ("inputs",): 0,
+                ("inputs", "p1"): p1_idx,
+                ("inputs", "p3"): p1_idx,
+                ("inputs", "p2"): p2_idx,
+            }
+        }
+        for p2_idx in range(2)
+        for p1_idx in range(3)
+    ]